@@ -10,6 +10,7 @@
 # --------------------------------------------------------------------------
 
 import uuid
+from msrest import Serializer
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
 from msrest.polling import LROPoller, NoPolling
@@ -17,6 +18,9 @@ from msrestazure.polling.arm_polling import ARMPolling
 
 from .. import models
 
+_API_VERSION = "2019-07-01"
+_API_VERSION_QUERY = Serializer().query("api_version", _API_VERSION, 'str')
+
 
 class GalleryImageVersionsOperations(object):
     """GalleryImageVersionsOperations operations.
@@ -37,7 +41,7 @@ class GalleryImageVersionsOperations(object):
         self._client = client
         self._serialize = serializer
         self._deserialize = deserializer
-        self.api_version = "2019-07-01"
+        self.api_version = _API_VERSION
 
         self.config = config
 
@@ -57,7 +61,7 @@ class GalleryImageVersionsOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
@@ -205,7 +209,7 @@ class GalleryImageVersionsOperations(object):
         query_parameters = {}
         if expand is not None:
             query_parameters['$expand'] = self._serialize.query("expand", expand, 'str')
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
@@ -253,7 +257,7 @@ class GalleryImageVersionsOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
@@ -363,7 +367,7 @@ class GalleryImageVersionsOperations(object):
 
                 # Construct parameters
                 query_parameters = {}
-                query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+                query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
             else:
                 url = next_link
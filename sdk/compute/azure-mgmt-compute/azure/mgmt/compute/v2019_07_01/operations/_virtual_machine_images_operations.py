@@ -10,11 +10,15 @@
 # --------------------------------------------------------------------------
 
 import uuid
+from msrest import Serializer
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
 
 from .. import models
 
+_API_VERSION = "2019-07-01"
+_API_VERSION_QUERY = Serializer().query("api_version", _API_VERSION, 'str')
+
 
 class VirtualMachineImagesOperations(object):
     """VirtualMachineImagesOperations operations.
@@ -35,10 +39,29 @@ class VirtualMachineImagesOperations(object):
         self._client = client
         self._serialize = serializer
         self._deserialize = deserializer
-        self.api_version = "2019-07-01"
+        self.api_version = _API_VERSION
 
         self.config = config
 
+    def _send_and_deserialize(self, request, response_type, raw, operation_config):
+        """Send a request that expects HTTP 200 and deserialize the response
+        as response_type.
+        """
+        response = self._client.send(request, stream=False, **operation_config)
+
+        if response.status_code != 200:
+            exp = CloudError(response)
+            exp.request_id = response.headers.get('x-ms-request-id')
+            raise exp
+
+        deserialized = self._deserialize(response_type, response)
+
+        if raw:
+            client_raw_response = ClientRawResponse(deserialized, response)
+            return client_raw_response
+
+        return deserialized
+
     def get(
             self, location, publisher_name, offer, skus, version, custom_headers=None, raw=False, **operation_config):
         """Gets a virtual machine image.
@@ -77,7 +100,7 @@ class VirtualMachineImagesOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
@@ -91,22 +114,7 @@ class VirtualMachineImagesOperations(object):
 
         # Construct and send request
         request = self._client.get(url, query_parameters, header_parameters)
-        response = self._client.send(request, stream=False, **operation_config)
-
-        if response.status_code not in [200]:
-            exp = CloudError(response)
-            exp.request_id = response.headers.get('x-ms-request-id')
-            raise exp
-
-        deserialized = None
-        if response.status_code == 200:
-            deserialized = self._deserialize('VirtualMachineImage', response)
-
-        if raw:
-            client_raw_response = ClientRawResponse(deserialized, response)
-            return client_raw_response
-
-        return deserialized
+        return self._send_and_deserialize(request, 'VirtualMachineImage', raw, operation_config)
     get.metadata = {'url': '/subscriptions/{subscriptionId}/providers/Microsoft.Compute/locations/{location}/publishers/{publisherName}/artifacttypes/vmimage/offers/{offer}/skus/{skus}/versions/{version}'}
 
     def list(
@@ -158,7 +166,7 @@ class VirtualMachineImagesOperations(object):
             query_parameters['$top'] = self._serialize.query("top", top, 'int')
         if orderby is not None:
             query_parameters['$orderby'] = self._serialize.query("orderby", orderby, 'str')
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
@@ -172,22 +180,7 @@ class VirtualMachineImagesOperations(object):
 
         # Construct and send request
         request = self._client.get(url, query_parameters, header_parameters)
-        response = self._client.send(request, stream=False, **operation_config)
-
-        if response.status_code not in [200]:
-            exp = CloudError(response)
-            exp.request_id = response.headers.get('x-ms-request-id')
-            raise exp
-
-        deserialized = None
-        if response.status_code == 200:
-            deserialized = self._deserialize('[VirtualMachineImageResource]', response)
-
-        if raw:
-            client_raw_response = ClientRawResponse(deserialized, response)
-            return client_raw_response
-
-        return deserialized
+        return self._send_and_deserialize(request, '[VirtualMachineImageResource]', raw, operation_config)
     list.metadata = {'url': '/subscriptions/{subscriptionId}/providers/Microsoft.Compute/locations/{location}/publishers/{publisherName}/artifacttypes/vmimage/offers/{offer}/skus/{skus}/versions'}
 
     def list_offers(
@@ -221,7 +214,7 @@ class VirtualMachineImagesOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
@@ -235,22 +228,7 @@ class VirtualMachineImagesOperations(object):
 
         # Construct and send request
         request = self._client.get(url, query_parameters, header_parameters)
-        response = self._client.send(request, stream=False, **operation_config)
-
-        if response.status_code not in [200]:
-            exp = CloudError(response)
-            exp.request_id = response.headers.get('x-ms-request-id')
-            raise exp
-
-        deserialized = None
-        if response.status_code == 200:
-            deserialized = self._deserialize('[VirtualMachineImageResource]', response)
-
-        if raw:
-            client_raw_response = ClientRawResponse(deserialized, response)
-            return client_raw_response
-
-        return deserialized
+        return self._send_and_deserialize(request, '[VirtualMachineImageResource]', raw, operation_config)
     list_offers.metadata = {'url': '/subscriptions/{subscriptionId}/providers/Microsoft.Compute/locations/{location}/publishers/{publisherName}/artifacttypes/vmimage/offers'}
 
     def list_publishers(
@@ -281,7 +259,7 @@ class VirtualMachineImagesOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
@@ -295,22 +273,7 @@ class VirtualMachineImagesOperations(object):
 
         # Construct and send request
         request = self._client.get(url, query_parameters, header_parameters)
-        response = self._client.send(request, stream=False, **operation_config)
-
-        if response.status_code not in [200]:
-            exp = CloudError(response)
-            exp.request_id = response.headers.get('x-ms-request-id')
-            raise exp
-
-        deserialized = None
-        if response.status_code == 200:
-            deserialized = self._deserialize('[VirtualMachineImageResource]', response)
-
-        if raw:
-            client_raw_response = ClientRawResponse(deserialized, response)
-            return client_raw_response
-
-        return deserialized
+        return self._send_and_deserialize(request, '[VirtualMachineImageResource]', raw, operation_config)
     list_publishers.metadata = {'url': '/subscriptions/{subscriptionId}/providers/Microsoft.Compute/locations/{location}/publishers'}
 
     def list_skus(
@@ -347,7 +310,7 @@ class VirtualMachineImagesOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
@@ -361,20 +324,5 @@ class VirtualMachineImagesOperations(object):
 
         # Construct and send request
         request = self._client.get(url, query_parameters, header_parameters)
-        response = self._client.send(request, stream=False, **operation_config)
-
-        if response.status_code not in [200]:
-            exp = CloudError(response)
-            exp.request_id = response.headers.get('x-ms-request-id')
-            raise exp
-
-        deserialized = None
-        if response.status_code == 200:
-            deserialized = self._deserialize('[VirtualMachineImageResource]', response)
-
-        if raw:
-            client_raw_response = ClientRawResponse(deserialized, response)
-            return client_raw_response
-
-        return deserialized
+        return self._send_and_deserialize(request, '[VirtualMachineImageResource]', raw, operation_config)
     list_skus.metadata = {'url': '/subscriptions/{subscriptionId}/providers/Microsoft.Compute/locations/{location}/publishers/{publisherName}/artifacttypes/vmimage/offers/{offer}/skus'}
@@ -10,6 +10,7 @@
 # --------------------------------------------------------------------------
 
 import uuid
+from msrest import Serializer
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
 from msrest.polling import LROPoller, NoPolling
@@ -17,6 +18,17 @@ from msrestazure.polling.arm_polling import ARMPolling
 
 from .. import models
 
+_API_VERSION = "2019-07-01"
+_API_VERSION_QUERY = Serializer().query("api_version", _API_VERSION, 'str')
+
+
+def _no_content_output(response):
+    return None
+
+
+def _raw_no_content_output(response):
+    return ClientRawResponse(None, response)
+
 
 class VirtualMachineScaleSetVMExtensionsOperations(object):
     """VirtualMachineScaleSetVMExtensionsOperations operations.
@@ -37,7 +49,7 @@ class VirtualMachineScaleSetVMExtensionsOperations(object):
         self._client = client
         self._serialize = serializer
         self._deserialize = deserializer
-        self.api_version = "2019-07-01"
+        self.api_version = _API_VERSION
 
         self.config = config
 
@@ -57,7 +69,7 @@ class VirtualMachineScaleSetVMExtensionsOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
@@ -169,7 +181,7 @@ class VirtualMachineScaleSetVMExtensionsOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
@@ -189,15 +201,12 @@ class VirtualMachineScaleSetVMExtensionsOperations(object):
         request = self._client.patch(url, query_parameters, header_parameters, body_content)
         response = self._client.send(request, stream=False, **operation_config)
 
-        if response.status_code not in [200]:
+        if response.status_code != 200:
             exp = CloudError(response)
             exp.request_id = response.headers.get('x-ms-request-id')
             raise exp
 
-        deserialized = None
-
-        if response.status_code == 200:
-            deserialized = self._deserialize('VirtualMachineExtension', response)
+        deserialized = self._deserialize('VirtualMachineExtension', response)
 
         if raw:
             client_raw_response = ClientRawResponse(deserialized, response)
@@ -279,7 +288,7 @@ class VirtualMachineScaleSetVMExtensionsOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
@@ -336,10 +345,7 @@ class VirtualMachineScaleSetVMExtensionsOperations(object):
             **operation_config
         )
 
-        def get_long_running_output(response):
-            if raw:
-                client_raw_response = ClientRawResponse(None, response)
-                return client_raw_response
+        get_long_running_output = _raw_no_content_output if raw else _no_content_output
 
         lro_delay = operation_config.get(
             'long_running_operation_timeout',
@@ -389,7 +395,7 @@ class VirtualMachineScaleSetVMExtensionsOperations(object):
         query_parameters = {}
         if expand is not None:
             query_parameters['$expand'] = self._serialize.query("expand", expand, 'str')
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
@@ -405,14 +411,12 @@ class VirtualMachineScaleSetVMExtensionsOperations(object):
         request = self._client.get(url, query_parameters, header_parameters)
         response = self._client.send(request, stream=False, **operation_config)
 
-        if response.status_code not in [200]:
+        if response.status_code != 200:
             exp = CloudError(response)
             exp.request_id = response.headers.get('x-ms-request-id')
             raise exp
 
-        deserialized = None
-        if response.status_code == 200:
-            deserialized = self._deserialize('VirtualMachineExtension', response)
+        deserialized = self._deserialize('VirtualMachineExtension', response)
 
         if raw:
             client_raw_response = ClientRawResponse(deserialized, response)
@@ -460,7 +464,7 @@ class VirtualMachineScaleSetVMExtensionsOperations(object):
         query_parameters = {}
         if expand is not None:
             query_parameters['$expand'] = self._serialize.query("expand", expand, 'str')
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
@@ -476,14 +480,12 @@ class VirtualMachineScaleSetVMExtensionsOperations(object):
         request = self._client.get(url, query_parameters, header_parameters)
         response = self._client.send(request, stream=False, **operation_config)
 
-        if response.status_code not in [200]:
+        if response.status_code != 200:
             exp = CloudError(response)
             exp.request_id = response.headers.get('x-ms-request-id')
             raise exp
 
-        deserialized = None
-        if response.status_code == 200:
-            deserialized = self._deserialize('VirtualMachineExtensionsListResult', response)
+        deserialized = self._deserialize('VirtualMachineExtensionsListResult', response)
 
         if raw:
             client_raw_response = ClientRawResponse(deserialized, response)
@@ -10,6 +10,7 @@
 # --------------------------------------------------------------------------
 
 import uuid
+from msrest import Serializer
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
 from msrest.polling import LROPoller, NoPolling
@@ -17,6 +18,9 @@ from msrestazure.polling.arm_polling import ARMPolling
 
 from .. import models
 
+_API_VERSION = "2019-07-01"
+_API_VERSION_QUERY = Serializer().query("api_version", _API_VERSION, 'str')
+
 
 class VirtualMachineScaleSetsOperations(object):
     """VirtualMachineScaleSetsOperations operations.
@@ -37,7 +41,7 @@ class VirtualMachineScaleSetsOperations(object):
         self._client = client
         self._serialize = serializer
         self._deserialize = deserializer
-        self.api_version = "2019-07-01"
+        self.api_version = _API_VERSION
 
         self.config = config
 
@@ -55,7 +59,7 @@ class VirtualMachineScaleSetsOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
@@ -159,7 +163,7 @@ class VirtualMachineScaleSetsOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
@@ -261,7 +265,7 @@ class VirtualMachineScaleSetsOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
@@ -355,7 +359,7 @@ class VirtualMachineScaleSetsOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
@@ -405,11 +409,12 @@ class VirtualMachineScaleSetsOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
-        header_parameters['Content-Type'] = 'application/json; charset=utf-8'
+        if vm_instance_ids is not None:
+            header_parameters['Content-Type'] = 'application/json; charset=utf-8'
         if self.config.generate_client_request_id:
             header_parameters['x-ms-client-request-id'] = str(uuid.uuid1())
         if custom_headers:
@@ -502,7 +507,7 @@ class VirtualMachineScaleSetsOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
@@ -605,7 +610,7 @@ class VirtualMachineScaleSetsOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
@@ -665,7 +670,7 @@ class VirtualMachineScaleSetsOperations(object):
 
                 # Construct parameters
                 query_parameters = {}
-                query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+                query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
             else:
                 url = next_link
@@ -734,7 +739,7 @@ class VirtualMachineScaleSetsOperations(object):
 
                 # Construct parameters
                 query_parameters = {}
-                query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+                query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
             else:
                 url = next_link
@@ -807,7 +812,7 @@ class VirtualMachineScaleSetsOperations(object):
 
                 # Construct parameters
                 query_parameters = {}
-                query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+                query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
             else:
                 url = next_link
@@ -880,7 +885,7 @@ class VirtualMachineScaleSetsOperations(object):
 
                 # Construct parameters
                 query_parameters = {}
-                query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+                query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
             else:
                 url = next_link
@@ -941,11 +946,12 @@ class VirtualMachineScaleSetsOperations(object):
         query_parameters = {}
         if skip_shutdown is not None:
             query_parameters['skipShutdown'] = self._serialize.query("skip_shutdown", skip_shutdown, 'bool')
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
-        header_parameters['Content-Type'] = 'application/json; charset=utf-8'
+        if vm_instance_ids is not None:
+            header_parameters['Content-Type'] = 'application/json; charset=utf-8'
         if self.config.generate_client_request_id:
             header_parameters['x-ms-client-request-id'] = str(uuid.uuid1())
         if custom_headers:
@@ -1046,11 +1052,12 @@ class VirtualMachineScaleSetsOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
-        header_parameters['Content-Type'] = 'application/json; charset=utf-8'
+        if vm_instance_ids is not None:
+            header_parameters['Content-Type'] = 'application/json; charset=utf-8'
         if self.config.generate_client_request_id:
             header_parameters['x-ms-client-request-id'] = str(uuid.uuid1())
         if custom_headers:
@@ -1142,11 +1149,12 @@ class VirtualMachineScaleSetsOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
-        header_parameters['Content-Type'] = 'application/json; charset=utf-8'
+        if vm_instance_ids is not None:
+            header_parameters['Content-Type'] = 'application/json; charset=utf-8'
         if self.config.generate_client_request_id:
             header_parameters['x-ms-client-request-id'] = str(uuid.uuid1())
         if custom_headers:
@@ -1238,11 +1246,12 @@ class VirtualMachineScaleSetsOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
-        header_parameters['Content-Type'] = 'application/json; charset=utf-8'
+        if vm_instance_ids is not None:
+            header_parameters['Content-Type'] = 'application/json; charset=utf-8'
         if self.config.generate_client_request_id:
             header_parameters['x-ms-client-request-id'] = str(uuid.uuid1())
         if custom_headers:
@@ -1335,11 +1344,12 @@ class VirtualMachineScaleSetsOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
-        header_parameters['Content-Type'] = 'application/json; charset=utf-8'
+        if vm_instance_ids is not None:
+            header_parameters['Content-Type'] = 'application/json; charset=utf-8'
         if self.config.generate_client_request_id:
             header_parameters['x-ms-client-request-id'] = str(uuid.uuid1())
         if custom_headers:
@@ -1432,7 +1442,7 @@ class VirtualMachineScaleSetsOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
@@ -1523,11 +1533,12 @@ class VirtualMachineScaleSetsOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
-        header_parameters['Content-Type'] = 'application/json; charset=utf-8'
+        if vm_scale_set_reimage_input is not None:
+            header_parameters['Content-Type'] = 'application/json; charset=utf-8'
         if self.config.generate_client_request_id:
             header_parameters['x-ms-client-request-id'] = str(uuid.uuid1())
         if custom_headers:
@@ -1627,11 +1638,12 @@ class VirtualMachineScaleSetsOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
 
         # Construct headers
         header_parameters = {}
-        header_parameters['Content-Type'] = 'application/json; charset=utf-8'
+        if vm_instance_ids is not None:
+            header_parameters['Content-Type'] = 'application/json; charset=utf-8'
         if self.config.generate_client_request_id:
             header_parameters['x-ms-client-request-id'] = str(uuid.uuid1())
         if custom_headers:
@@ -1739,7 +1751,7 @@ class VirtualMachineScaleSetsOperations(object):
 
         # Construct parameters
         query_parameters = {}
-        query_parameters['api-version'] = self._serialize.query("self.api_version", self.api_version, 'str')
+        query_parameters['api-version'] = _API_VERSION_QUERY if self.api_version == _API_VERSION else self._serialize.query("self.api_version", self.api_version, 'str')
         query_parameters['platformUpdateDomain'] = self._serialize.query("platform_update_domain", platform_update_domain, 'int')
 
         # Construct headers